@@ -37,9 +37,37 @@ import os
 import time
 import datetime
 import platform
-from bpy.props import StringProperty, BoolProperty, EnumProperty, PointerProperty
+import subprocess
+from bpy.props import StringProperty, BoolProperty, IntProperty, EnumProperty, PointerProperty
 from bpy.types import PropertyGroup, Operator, Panel
-from collections import deque
+
+# Render engine -> output filename prefix
+_ENGINE_PREFIX = {
+    "CYCLES": "C",
+    "BLENDER_EEVEE_NEXT": "E",
+    "BLENDER_EEVEE": "E",
+    "BLENDER_WORKBENCH": "W"
+}
+
+# Cached layer_collection_index() per view layer, cleared when collections
+# change or when undo/file load invalidates the LayerCollection references
+_LC_CACHE = {}
+
+# Cycles compute backends, in order of preference
+_GPU_BACKENDS = ("OPTIX", "CUDA", "HIP", "ONEAPI", "METAL")
+
+# Backends whose devices can be pinned per process with CUDA_VISIBLE_DEVICES
+_PINNABLE_BACKENDS = ("OPTIX", "CUDA")
+
+# Script run by each background Blender process in parallel batch renders:
+# load this add-on file as a module and hand over to render_worker()
+_WORKER_SCRIPT = """
+import importlib.util
+spec = importlib.util.spec_from_file_location("camera_render_worker", {addon_file!r})
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+module.render_worker({jobs!r}, {log_path!r}, {n!r}, {gpu_backend!r})
+"""
 
 # --------------------------
 # Utility
@@ -60,18 +88,72 @@ def get_renderable_cameras():
     return [cam for cam in get_all_camera_objects() if is_renderable(cam)]
 
 def collections_of_object(obj):
-    name = obj.name
-    return [col for col in bpy.data.collections if col.objects.get(name) is not None]
+    # Skip scene master collections, which are not part of bpy.data.collections
+    return [col for col in obj.users_collection if not col.is_embedded_data]
+
+def collections_by_object(objects):
+    names = {obj.name for obj in objects}
+    index = {name: [] for name in names}
+    for col in bpy.data.collections:
+        for obj in col.objects:
+            if obj.name in names:
+                index[obj.name].append(col)
+    return index
+
+def enable_gpu_devices(scene, backends=_GPU_BACKENDS):
+    prefs = bpy.context.preferences.addons['cycles'].preferences
+    original_type = prefs.compute_device_type
+    for backend in backends:
+        try:
+            prefs.compute_device_type = backend
+        except TypeError:
+            continue  # backend not supported on this platform/build
+        prefs.refresh_devices()
+        devices = [d for d in prefs.devices if d.type == backend]
+        if devices:
+            break
+    else:
+        prefs.compute_device_type = original_type
+        return None, []
+    for d in prefs.devices:
+        d.use = (d.type == backend)
+    scene.cycles.device = 'GPU'
+    return backend, [d.name for d in devices]
+
+def cycles_compute_devices():
+    addon = bpy.context.preferences.addons.get('cycles')
+    if addon is None:
+        return 'NONE', 0
+    prefs = addon.preferences
+    prefs.refresh_devices()
+    device_type = prefs.compute_device_type
+    return device_type, sum(1 for d in prefs.devices if d.type == device_type)
 
 def iter_layer_collections(root):
-    q = deque([root])
-    while q:
-        lc = q.popleft()
+    stack = [root]
+    while stack:
+        lc = stack.pop()
         yield lc
-        q.extend(lc.children)
+        stack.extend(lc.children)
 
 def layer_collections_for_collection(view_layer, collection):
-    return [lc for lc in iter_layer_collections(view_layer.layer_collection) if lc.collection == collection]
+    return layer_collection_index(view_layer).get(collection, [])
+
+def layer_collection_index(view_layer):
+    index = {}
+    for lc in iter_layer_collections(view_layer.layer_collection):
+        index.setdefault(lc.collection, []).append(lc)
+    return index
+
+def _get_lc_index(view_layer):
+    key = (view_layer.id_data.session_uid, view_layer.name)
+    # A view layer re-created under the same name gets a new layer
+    # collection tree; never hand out references into the freed one
+    root_ptr = (view_layer.as_pointer(), view_layer.layer_collection.as_pointer())
+    entry = _LC_CACHE.get(key)
+    if entry is None or entry[0] != root_ptr:
+        entry = _LC_CACHE[key] = (root_ptr, layer_collection_index(view_layer))
+    return entry[1]
 
 def set_collection_render_enabled(context, collection, enabled):
     for lc in layer_collections_for_collection(context.view_layer, collection):
@@ -109,6 +191,28 @@ class CameraRenderSettings(PropertyGroup):
         description="Shutdown the computer after all renders complete",
         default=False
     )
+    force_gpu: BoolProperty(
+        name="Force GPU render",
+        description="Switch Cycles to GPU compute and enable all available GPU devices before rendering",
+        default=False
+    )
+    parallel_processes: BoolProperty(
+        name="Parallel per GPU",
+        description="Split the cameras across background Blender processes (uses the saved .blend file). "
+                    "With Cycles on CUDA/OptiX each process is pinned to its own GPU",
+        default=False
+    )
+    process_count: IntProperty(
+        name="Processes",
+        description="Number of background Blender processes to run",
+        default=2,
+        min=1
+    )
+    background_render: BoolProperty(
+        name="Keep UI responsive",
+        description="Start each camera's render in the background and continue with the next one when it completes",
+        default=False
+    )
 
 # --------------------------
 # Camera Render Toggle Operator
@@ -124,6 +228,7 @@ class OBJECT_OT_toggle_camera_render(Operator):
         _ensure_state_prop()
         wm = context.window_manager
         scene = context.scene
+        view_layer = context.view_layer
         active_camera = scene.camera
         all_cameras = get_all_camera_objects()
 
@@ -134,23 +239,76 @@ class OBJECT_OT_toggle_camera_render(Operator):
         if active_camera is None:
             active_camera = all_cameras[0]
 
+        cam_to_cols = collections_by_object(all_cameras)
+        layer_cols = _get_lc_index(view_layer).get
+        cam_cols = [cam_to_cols[cam.name] for cam in all_cameras]
+
         if wm.cam_toggle_last_action != 'disabled_others':
-            for cam in all_cameras:
-                is_active = (cam == active_camera)
-                cam.hide_render = not is_active
-                for col in collections_of_object(cam):
-                    set_collection_render_enabled(context, col, is_active)
+            flags = [cam != active_camera for cam in all_cameras]
+            # Only write changed values: each RNA write tags the depsgraph
+            for cam, hidden in zip(all_cameras, flags):
+                if cam.hide_render != hidden:
+                    cam.hide_render = hidden
+            for cols, hidden in zip(cam_cols, flags):
+                for col in cols:
+                    for lc in layer_cols(col, ()):
+                        if lc.exclude != hidden:
+                            lc.exclude = hidden
             wm.cam_toggle_last_action = 'disabled_others'
             self.report({'INFO'}, f"📷 Non-active cameras disabled. Active camera: \"{active_camera.name}\"")
         else:
             for cam in all_cameras:
-                cam.hide_render = False
-                for col in collections_of_object(cam):
-                    set_collection_render_enabled(context, col, True)
+                if cam.hide_render:
+                    cam.hide_render = False
+            for cols in cam_cols:
+                for col in cols:
+                    for lc in layer_cols(col, ()):
+                        if lc.exclude:
+                            lc.exclude = False
             wm.cam_toggle_last_action = 'enabled_all'
             self.report({'INFO'}, "✅ All cameras enabled for rendering.")
         return {'FINISHED'}
 
+# --------------------------
+# Parallel Render Worker
+# --------------------------
+
+def render_worker(jobs, log_path, n, gpu_backend=None):
+    scene = bpy.context.scene
+    with open(log_path, 'w', encoding='utf-8') as log_file:
+        if gpu_backend is not None:
+            backend, devices = enable_gpu_devices(scene, (gpu_backend,))
+            if backend is None:
+                log_file.write("GPU: no compute device found, rendering on CPU\n")
+            else:
+                log_file.write(f"GPU: {backend} ({', '.join(devices)})\n")
+
+        failed = []
+        for idx, cam_name, output_path in jobs:
+            start_time = time.time()
+            start_str = datetime.datetime.now().strftime("%H:%M:%S")
+            log_file.write(f"[{idx}/{n}] Started rendering: {cam_name} at {start_str}\n")
+            log_file.flush()
+            # One bad camera (e.g. renamed since the last save) must not
+            # drop the rest of this worker's cameras
+            try:
+                scene.camera = bpy.data.objects[cam_name]
+                scene.render.filepath = output_path
+                bpy.ops.render.render(animation=True)
+            except Exception as e:
+                log_file.write(f"[{idx}/{n}] Failed: {cam_name} ({e!r})\n\n")
+                log_file.flush()
+                failed.append(cam_name)
+                continue
+            mins, secs = divmod(time.time() - start_time, 60)
+            end_str = datetime.datetime.now().strftime("%H:%M:%S")
+            log_file.write(f"[{idx}/{n}] Finished: {cam_name} at {end_str} ({int(mins)}m {int(secs)}s)\n\n")
+            log_file.flush()
+
+    if failed:
+        # Surfaces as a non-zero exit code via --python-exit-code
+        raise RuntimeError(f"Failed to render: {', '.join(failed)}")
+
 # --------------------------
 # Batch Render Operator
 # --------------------------
@@ -161,74 +319,272 @@ class OBJECT_OT_batch_render_active_cameras(Operator):
     bl_description = "Renders only cameras that are enabled for render"
     bl_options = {'REGISTER'}
 
-    def execute(self, context):
+    _timer = None
+
+    def _start_batch(self, context):
         scene = context.scene
         settings = scene.camera_render_settings
         output_dir = bpy.path.abspath(settings.output_dir)
 
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
 
         render_engine = scene.render.engine
-        # Get render engine prefix
-        engine_map = {
-            "CYCLES": "C",
-            "BLENDER_EEVEE_NEXT": "E",
-            "BLENDER_EEVEE": "E",
-            "BLENDER_WORKBENCH": "W"
-        }
-        egn = engine_map.get(scene.render.engine, "X")  # 'X' = unknown
+        egn = _ENGINE_PREFIX.get(render_engine, "X")  # 'X' = unknown
+
+        hidden_cols = {col for col in bpy.data.collections if col.hide_render}
+        all_cameras, renderable_cameras, skipped_cameras = [], [], []
+        for obj in bpy.data.objects:
+            if obj.type != 'CAMERA':
+                continue
+            all_cameras.append(obj)
+            if not obj.hide_render and hidden_cols.isdisjoint(obj.users_collection):
+                renderable_cameras.append(obj)
+            else:
+                skipped_cameras.append(obj.name)
 
-        all_cameras = get_all_camera_objects()
-        renderable_cameras = get_renderable_cameras()
-        skipped_cameras = [cam.name for cam in all_cameras if cam not in renderable_cameras]
+        # One timestamp per batch so every file from this run shares it
+        batch_ts = datetime.datetime.now().strftime("%Y%m%d_%H%M")
+        plan = [
+            (idx, cam, cam.name, os.path.join(output_dir, f"{egn}_{cam.name}_{batch_ts}"))
+            for idx, cam in enumerate(renderable_cameras, start=1)
+        ]
+
+        use_gpu = settings.force_gpu and render_engine == "CYCLES"
+        self._gpu_backend = None
+        if use_gpu:
+            backend, devices = enable_gpu_devices(scene)
+            self._gpu_backend = backend
 
         log_path = os.path.join(output_dir, "render_log.txt")
-        with open(log_path, 'w', encoding='utf-8') as log_file:
-            log_file.write(f"Total cameras: {len(all_cameras)}\n")
-            if skipped_cameras:
-                log_file.write(f"Skipped cameras: {', '.join(skipped_cameras)}\n")
+        log_file = open(log_path, 'w', encoding='utf-8', buffering=1 << 16)
+        log_file.write(f"Total cameras: {len(all_cameras)}\n")
+        if skipped_cameras:
+            log_file.write(f"Skipped cameras: {', '.join(skipped_cameras)}\n")
+        else:
+            log_file.write("No skipped cameras.\n")
+        log_file.write(f"Renderable cameras: {len(plan)}\n")
+        if use_gpu:
+            if backend is None:
+                log_file.write("GPU: no compute device found, rendering on CPU\n")
+                self.report({'WARNING'}, "No GPU compute device found, rendering on CPU.")
             else:
-                log_file.write("No skipped cameras.\n")
-            log_file.write(f"Renderable cameras: {len(renderable_cameras)}\n\n")
-
-        for idx, cam in enumerate(renderable_cameras, start=1):
-            scene.camera = cam
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M")
-            output_path = os.path.join(output_dir, f"{egn}_{cam.name}_{timestamp}")
-            scene.render.filepath = output_path
-
-            start_time = time.time()
-            start_str = datetime.datetime.now().strftime("%H:%M:%S")
-            self.report({'INFO'}, f"[{idx}/{len(renderable_cameras)}] Rendering {cam.name}...")
+                log_file.write(f"GPU: {backend} ({', '.join(devices)})\n")
+        log_file.write("\n")
+        return plan, log_file
 
-            with open(log_path, 'a', encoding='utf-8') as log_file:
-                log_file.write(f"[{idx}/{len(renderable_cameras)}] Started rendering: {cam.name} at {start_str}\n")
+    def _begin_camera(self, context, log_file, n, idx, cam, cam_name, output_path):
+        scene = context.scene
+        scene.camera = cam
+        scene.render.filepath = output_path
 
-            bpy.ops.render.render(animation=True)
+        start_str = datetime.datetime.now().strftime("%H:%M:%S")
+        self.report({'INFO'}, f"[{idx}/{n}] Rendering {cam_name}...")
+        log_file.write(f"[{idx}/{n}] Started rendering: {cam_name} at {start_str}\n")
+        log_file.flush()
+        return time.time()
 
-            end_time = time.time()
-            end_str = datetime.datetime.now().strftime("%H:%M:%S")
-            mins, secs = divmod(end_time - start_time, 60)
+    def _end_camera(self, log_file, n, idx, cam_name, start_time):
+        end_time = time.time()
+        end_str = datetime.datetime.now().strftime("%H:%M:%S")
+        mins, secs = divmod(end_time - start_time, 60)
 
-            with open(log_path, 'a', encoding='utf-8') as log_file:
-                log_file.write(f"[{idx}/{len(renderable_cameras)}] Finished: {cam.name} at {end_str} ({int(mins)}m {int(secs)}s)\n\n")
+        log_file.write(f"[{idx}/{n}] Finished: {cam_name} at {end_str} ({int(mins)}m {int(secs)}s)\n\n")
+        # Keep the log usable if Blender dies mid-batch
+        log_file.flush()
 
+    def _finish_batch(self, context):
         def draw(self, context):
             self.layout.label(text="✅ Rendering complete.")
-        bpy.context.window_manager.popup_menu(draw, title="Done", icon='RENDER_RESULT')
+        context.window_manager.popup_menu(draw, title="Done", icon='RENDER_RESULT')
 
-        if settings.shutdown_after:
+        if context.scene.camera_render_settings.shutdown_after:
             system = platform.system()
             if system == "Windows":
-                os.system("shutdown /s /t 60 /f")
+                argv = ["shutdown", "/s", "/t", "60", "/f"]
             elif system == "Darwin":
-                os.system("sudo shutdown -h +1")
+                argv = ["sudo", "shutdown", "-h", "+1"]
             elif system == "Linux":
-                os.system("shutdown -h +1")
+                argv = ["shutdown", "-h", "+1"]
+            else:
+                return
+            try:
+                returncode = subprocess.run(argv, check=False).returncode
+            except OSError as e:
+                self.report({'WARNING'}, f"Shutdown failed: {e}")
+                return
+            if returncode != 0:
+                self.report({'WARNING'}, f"Shutdown failed: \"{' '.join(argv)}\" exited with code {returncode}")
+
+    def _render_parallel(self, context, plan, log_file):
+        settings = context.scene.camera_render_settings
+        log_dir = os.path.dirname(log_file.name)
+        n = len(plan)
+        procs = min(settings.process_count, n)
+        self.report({'INFO'}, f"Rendering {n} cameras in {procs} background processes...")
+
+        render_engine = context.scene.render.engine
+        device_type, gpu_count = ('NONE', 0)
+        if render_engine == "CYCLES":
+            device_type, gpu_count = cycles_compute_devices()
+        pinned = device_type in _PINNABLE_BACKENDS
+
+        if pinned:
+            if procs > gpu_count:
+                log_file.write(f"WARNING: {procs} processes but {gpu_count} {device_type} devices; "
+                               f"processes {gpu_count}-{procs - 1} have no GPU and may render on CPU\n\n")
+                self.report({'WARNING'}, f"Only {gpu_count} GPU devices for {procs} render processes.")
+        else:
+            what = f"Cycles with {device_type}" if render_engine == "CYCLES" else render_engine
+            log_file.write(f"NOTE: {what} cannot be pinned to one GPU per process; "
+                           f"all {procs} processes share the same device(s)\n\n")
+
+        workers = []
+        try:
+            for i in range(procs):
+                jobs = [(idx, cam_name, output_path) for idx, _cam, cam_name, output_path in plan[i::procs]]
+                worker_log = os.path.join(log_dir, f"render_log_{i}.txt")
+                script = _WORKER_SCRIPT.format(
+                    addon_file=os.path.abspath(__file__),
+                    jobs=jobs,
+                    log_path=worker_log,
+                    n=n,
+                    gpu_backend=self._gpu_backend,
+                )
+                proc = subprocess.Popen(
+                    [bpy.app.binary_path, "--background", bpy.data.filepath,
+                     "--python-exit-code", "1", "--python-expr", script],
+                    env={**os.environ, "CUDA_VISIBLE_DEVICES": str(i)} if pinned else None,
+                    close_fds=True,
+                )
+                workers.append((i, proc, worker_log))
+        except BaseException:
+            # Don't leave already started workers rendering unattended
+            for _i, proc, worker_log in workers:
+                proc.kill()
+                proc.wait()
+                if os.path.exists(worker_log):
+                    os.remove(worker_log)
+            raise
+
+        for i, proc, worker_log in workers:
+            returncode = proc.wait()
+            log_file.write(f"--- Process {i} (GPU {i}) ---\n" if pinned else f"--- Process {i} ---\n")
+            if os.path.exists(worker_log):
+                with open(worker_log, 'r', encoding='utf-8') as f:
+                    log_file.write(f.read())
+                os.remove(worker_log)
+            if returncode != 0:
+                log_file.write(f"Process {i} exited with code {returncode}\n\n")
+                self.report({'WARNING'}, f"Render process {i} exited with code {returncode}")
+
+    def execute(self, context):
+        settings = context.scene.camera_render_settings
+        if settings.parallel_processes:
+            if not bpy.data.filepath:
+                self.report({'ERROR'}, "Save the .blend file before rendering in parallel processes.")
+                return {'CANCELLED'}
+            if bpy.data.is_dirty:
+                self.report({'WARNING'}, "Unsaved changes are not included in parallel renders.")
+
+        plan, log_file = self._start_batch(context)
+        n = len(plan)
+        with log_file:
+            if settings.parallel_processes and plan:
+                self._render_parallel(context, plan, log_file)
+            else:
+                for idx, cam, cam_name, output_path in plan:
+                    start_time = self._begin_camera(context, log_file, n, idx, cam, cam_name, output_path)
+                    bpy.ops.render.render(animation=True)
+                    self._end_camera(log_file, n, idx, cam_name, start_time)
 
+        self._finish_batch(context)
         return {'FINISHED'}
 
+    # Non-blocking path: render one camera at a time and chain the next
+    # render from render_complete, so the UI stays responsive.
+
+    def invoke(self, context, event):
+        settings = context.scene.camera_render_settings
+        if settings.parallel_processes or not settings.background_render:
+            return self.execute(context)
+
+        self._plan, self._log_file = self._start_batch(context)
+        self._n = len(self._plan)
+        self._next = 0
+        self._current = None
+        self._rendering = False
+        self._cancelled = False
+
+        bpy.app.handlers.render_complete.append(self._on_render_complete)
+        bpy.app.handlers.render_cancel.append(self._on_render_cancel)
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.5, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def _on_render_complete(self, scene, *args):
+        self._rendering = False
+
+    def _on_render_cancel(self, scene, *args):
+        self._rendering = False
+        self._cancelled = True
+
+    def _cleanup(self, context):
+        if self._on_render_complete in bpy.app.handlers.render_complete:
+            bpy.app.handlers.render_complete.remove(self._on_render_complete)
+        if self._on_render_cancel in bpy.app.handlers.render_cancel:
+            bpy.app.handlers.render_cancel.remove(self._on_render_cancel)
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        self._log_file.close()
+
+    def cancel(self, context):
+        self._cleanup(context)
+
+    def modal(self, context, event):
+        # render_complete fires before the render job is removed, so also
+        # wait for the job itself to finish before starting the next one
+        if event.type != 'TIMER' or self._rendering or bpy.app.is_job_running('RENDER'):
+            return {'PASS_THROUGH'}
+
+        try:
+            if self._cancelled:
+                idx, cam_name, _start_time = self._current
+                end_str = datetime.datetime.now().strftime("%H:%M:%S")
+                self._log_file.write(f"[{idx}/{self._n}] Cancelled: {cam_name} at {end_str}\n")
+                self._cleanup(context)
+                self.report({'WARNING'}, "Batch render cancelled.")
+                return {'CANCELLED'}
+
+            if self._current is not None:
+                self._end_camera(self._log_file, self._n, *self._current)
+                self._current = None
+
+            if self._next >= self._n:
+                self._cleanup(context)
+                self._finish_batch(context)
+                return {'FINISHED'}
+
+            idx, cam, cam_name, output_path = self._plan[self._next]
+            start_time = self._begin_camera(context, self._log_file, self._n, idx, cam, cam_name, output_path)
+            # Set before invoking: the completion handler runs on the job thread
+            self._rendering = True
+            if bpy.ops.render.render('INVOKE_DEFAULT', animation=True) == {'CANCELLED'}:
+                self._rendering = False
+                self._log_file.write(f"[{idx}/{self._n}] Render refused by Blender: {cam_name}\n")
+                self._cleanup(context)
+                self.report({'ERROR'}, f"Blender refused to start rendering {cam_name}; batch stopped.")
+                return {'CANCELLED'}
+            self._current = (idx, cam_name, start_time)
+            self._next += 1
+        except Exception:
+            self._cleanup(context)
+            raise
+
+        return {'PASS_THROUGH'}
+
 # --------------------------
 # Panel
 # --------------------------
@@ -250,8 +606,36 @@ class CAMERA_RENDER_PT_tools_panel(Panel):
         layout.separator()
         layout.prop(settings, "output_dir")
         layout.prop(settings, "shutdown_after")
+        layout.prop(settings, "force_gpu")
+        layout.prop(settings, "background_render")
+        layout.prop(settings, "parallel_processes")
+        row = layout.row()
+        row.enabled = settings.parallel_processes
+        row.prop(settings, "process_count")
         layout.operator("object.batch_render_active_cameras", icon='RENDER_ANIMATION')
 
+# --------------------------
+# Handlers
+# --------------------------
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph):
+    # Not Scene: the toggle's own lc.exclude writes tag the Scene, which
+    # would empty the cache on every toggle. View layers re-created under
+    # the same name are caught by the root pointer check in _get_lc_index.
+    if _LC_CACHE and any(isinstance(u.id, bpy.types.Collection) for u in depsgraph.updates):
+        _LC_CACHE.clear()
+
+@bpy.app.handlers.persistent
+def _clear_lc_cache(*args):
+    _LC_CACHE.clear()
+
+_CACHE_CLEAR_HANDLERS = (
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+    bpy.app.handlers.load_post,
+)
+
 # --------------------------
 # Register
 # --------------------------
@@ -268,8 +652,17 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.camera_render_settings = PointerProperty(type=CameraRenderSettings)
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    for handlers in _CACHE_CLEAR_HANDLERS:
+        handlers.append(_clear_lc_cache)
 
 def unregister():
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    for handlers in _CACHE_CLEAR_HANDLERS:
+        if _clear_lc_cache in handlers:
+            handlers.remove(_clear_lc_cache)
+    _LC_CACHE.clear()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     if hasattr(bpy.types.WindowManager, "cam_toggle_last_action"):